@@ -0,0 +1,224 @@
+"""A Myers O(ND) diff implementation for use in fixing.
+
+The standard library differ (`difflib.SequenceMatcher`) implements the
+Ratcliff/Obershelp algorithm, which behaves badly on long sequences with
+a small alphabet (i.e. any character-level diff of a SQL file). Here we
+implement the divide-and-conquer variant of the Myers diff algorithm
+(An O(ND) Difference Algorithm and Its Variations, Myers 1986), which
+runs in time proportional to the *size of the difference* - and the
+differences between the raw, templated and fixed versions of a file are
+usually small.
+
+The public entrypoint is `myers_opcodes`, which returns opcodes with the
+same contract as `difflib.SequenceMatcher.get_opcodes`: a list of tuples
+`(tag, i1, i2, j1, j2)` where tag is one of 'equal', 'replace', 'delete'
+or 'insert', covering both sequences completely and in order.
+"""
+
+
+def _find_middle_snake(a, alo, ahi, b, blo, bhi):
+    """Find the middle snake of the optimal edit path.
+
+    Runs the forward and backward searches of the Myers algorithm
+    simultaneously until they overlap. Returns a tuple of
+    (d, x, y, u, v) where d is the length of the optimal edit
+    script and (x, y) -> (u, v) is a (possibly empty) run of matching
+    elements lying on it. Coordinates are relative to (alo, blo).
+    """
+    n = ahi - alo
+    m = bhi - blo
+    delta = n - m
+    odd = delta % 2 != 0
+    max_d = (n + m + 1) // 2
+    # Furthest reaching forward and backward x values by k-diagonal.
+    # NB: Indexed by k directly - python's negative indexing wraps
+    # around, which is exactly what we want here.
+    vf = [0] * (2 * max_d + 2)
+    vb = [0] * (2 * max_d + 2)
+    for d in range(max_d + 1):
+        # Forward search.
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and vf[k - 1] < vf[k + 1]):
+                x = vf[k + 1]
+            else:
+                x = vf[k - 1] + 1
+            y = x - k
+            x_snake, y_snake = x, y
+            while x < n and y < m and a[alo + x] == b[blo + y]:
+                x += 1
+                y += 1
+            vf[k] = x
+            if odd and -(d - 1) <= delta - k <= d - 1:
+                if vf[k] + vb[delta - k] >= n:
+                    return 2 * d - 1, x_snake, y_snake, x, y
+        # Backward search (in terms of the reversed sequences).
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and vb[k - 1] < vb[k + 1]):
+                x = vb[k + 1]
+            else:
+                x = vb[k - 1] + 1
+            y = x - k
+            x_snake, y_snake = x, y
+            while x < n and y < m and a[ahi - x - 1] == b[bhi - y - 1]:
+                x += 1
+                y += 1
+            vb[k] = x
+            if not odd and -d <= delta - k <= d:
+                if vb[k] + vf[delta - k] >= n:
+                    return 2 * d, n - x, m - y, n - x_snake, m - y_snake
+    # Given max_d covers the whole edit graph we should never get here.
+    raise RuntimeError(  # pragma: no cover
+        "Myers diff failed to find a middle snake. Please report this "
+        "issue on github."
+    )
+
+
+def _single_edit_matches(a, alo, ahi, b, blo, bhi, matches):
+    """Emit matching runs for sequences at most one edit apart.
+
+    With at most one insertion or deletion between the two sequences,
+    everything after the common prefix lines up once we skip a single
+    element of the longer sequence.
+    """
+    n = ahi - alo
+    m = bhi - blo
+    shorter = min(n, m)
+    prefix = 0
+    while prefix < shorter and a[alo + prefix] == b[blo + prefix]:
+        prefix += 1
+    if prefix:
+        matches.append((alo, blo, prefix))
+    rest = shorter - prefix
+    if rest:
+        matches.append(
+            (
+                alo + prefix + (1 if n > m else 0),
+                blo + prefix + (1 if m > n else 0),
+                rest,
+            )
+        )
+
+
+def _myers_matches(a, alo, ahi, b, blo, bhi, matches):
+    """Recursively accumulate matching runs between a and b.
+
+    Appends tuples of (a_idx, b_idx, length) to `matches` in order.
+    The recursion depth is O(log D) because each middle snake splits
+    the remaining edit script roughly in half.
+    """
+    if ahi - alo == 0 or bhi - blo == 0:
+        return
+    d, x, y, u, v = _find_middle_snake(a, alo, ahi, b, blo, bhi)
+    if d > 1 or (x != u and y != v):
+        _myers_matches(a, alo, alo + x, b, blo, blo + y, matches)
+        if u > x:
+            matches.append((alo + x, blo + y, u - x))
+        _myers_matches(a, alo + u, ahi, b, blo + v, bhi, matches)
+    else:
+        # The sequences are at most one edit apart - no need to recurse.
+        _single_edit_matches(a, alo, ahi, b, blo, bhi, matches)
+
+
+def _matches_to_opcodes(matches, len_a, len_b):
+    """Convert matching runs into difflib-style opcodes."""
+    opcodes = []
+    i = j = 0
+    for ai, bj, size in matches:
+        # Coalesce runs which directly follow on from the last one.
+        if size and opcodes and opcodes[-1][0] == "equal":
+            _, e1, e2, e3, e4 = opcodes[-1]
+            if e2 == ai and e4 == bj:
+                opcodes[-1] = ("equal", e1, ai + size, e3, bj + size)
+                i, j = ai + size, bj + size
+                continue
+        if i < ai and j < bj:
+            opcodes.append(("replace", i, ai, j, bj))
+        elif i < ai:
+            opcodes.append(("delete", i, ai, j, bj))
+        elif j < bj:
+            opcodes.append(("insert", i, ai, j, bj))
+        i, j = ai + size, bj + size
+        if size:
+            opcodes.append(("equal", ai, i, bj, j))
+    # Deal with any unmatched tail.
+    if i < len_a and j < len_b:
+        opcodes.append(("replace", i, len_a, j, len_b))
+    elif i < len_a:
+        opcodes.append(("delete", i, len_a, j, len_b))
+    elif j < len_b:
+        opcodes.append(("insert", i, len_a, j, len_b))
+    return opcodes
+
+
+def myers_opcodes(a, b):
+    """Diff two sequences, returning difflib-style opcodes.
+
+    This runs in O((N + M) * D) time, where D is the size of the
+    difference between the sequences - rather than their length - which
+    makes it dramatically faster than `difflib.SequenceMatcher` in the
+    common linting case of two long, mostly-similar files.
+    """
+    len_a, len_b = len(a), len(b)
+    # Trim any common prefix and suffix first. These are usually most
+    # of the file and cost only a linear scan.
+    shorter = min(len_a, len_b)
+    prefix = 0
+    while prefix < shorter and a[prefix] == b[prefix]:
+        prefix += 1
+    suffix = 0
+    while (
+        suffix < shorter - prefix
+        and a[len_a - suffix - 1] == b[len_b - suffix - 1]
+    ):
+        suffix += 1
+    matches = []
+    if prefix:
+        matches.append((0, 0, prefix))
+    _myers_matches(a, prefix, len_a - suffix, b, prefix, len_b - suffix, matches)
+    if suffix:
+        matches.append((len_a - suffix, len_b - suffix, suffix))
+    return _matches_to_opcodes(matches, len_a, len_b)
+
+
+def myers_line_opcodes(a, b):
+    """Diff two strings line-first, returning character-offset opcodes.
+
+    Diffing by lines rather than characters makes each element of the
+    sequence high-entropy (whole lines rarely repeat, single characters
+    always do), so the diff converges much faster on real files. Any
+    lines which *changed* are then re-diffed at the character level so
+    the resulting opcodes are just as fine-grained as a pure character
+    diff. Indices in the returned opcodes are character offsets.
+    """
+    a_lines = a.splitlines(keepends=True)
+    b_lines = b.splitlines(keepends=True)
+    # Prefix-sum the line lengths to map line indices to char offsets.
+    a_offsets = [0]
+    for line in a_lines:
+        a_offsets.append(a_offsets[-1] + len(line))
+    b_offsets = [0]
+    for line in b_lines:
+        b_offsets.append(b_offsets[-1] + len(line))
+
+    opcodes = []
+
+    def _append(opcode):
+        # Coalesce equal blocks which abut (a refined replace block can
+        # start or end with an equal run touching a line-level one).
+        if opcode[0] == "equal" and opcodes and opcodes[-1][0] == "equal":
+            _, e1, e2, e3, e4 = opcodes[-1]
+            if e2 == opcode[1] and e4 == opcode[3]:
+                opcodes[-1] = ("equal", e1, opcode[2], e3, opcode[4])
+                return
+        opcodes.append(opcode)
+
+    for tag, i1, i2, j1, j2 in myers_opcodes(a_lines, b_lines):
+        ca1, ca2 = a_offsets[i1], a_offsets[i2]
+        cb1, cb2 = b_offsets[j1], b_offsets[j2]
+        if tag == "replace":
+            # Refine changed regions at the character level.
+            for sub_tag, s1, s2, s3, s4 in myers_opcodes(a[ca1:ca2], b[cb1:cb2]):
+                _append((sub_tag, s1 + ca1, s2 + ca1, s3 + cb1, s4 + cb1))
+        else:
+            _append((tag, ca1, ca2, cb1, cb2))
+    return opcodes
@@ -22,11 +22,20 @@ class SQLBaseError(ValueError):
         NB: This only returns a real code for some subclasses of
         error, (the ones with a `rule` attribute), but otherwise
         returns a placeholder value which can be used instead.
+
+        The result is memoized on the instance because violations are
+        re-filtered several times during result aggregation.
         """
+        try:
+            return self._rule_code
+        except AttributeError:
+            pass
         if hasattr(self, "rule"):
-            return self.rule.code
+            code = self.rule.code
         else:
-            return self._code or "????"
+            code = self._code or "????"
+        self._rule_code = code
+        return code
 
     def desc(self):
         """Fetch a description of this violation.
@@ -52,12 +61,17 @@ class SQLBaseError(ValueError):
                 return self.__class__.__name__
 
     def line_no(self):
-        """Return the line number of the violation."""
+        """Return the line number of the violation.
+
+        Memoized in the same way as `rule_code`.
+        """
+        try:
+            return self._line_no
+        except AttributeError:
+            pass
         pm = self.pos_marker()
-        if pm:
-            return pm.line_no
-        else:
-            return None
+        self._line_no = pm.line_no if pm else None
+        return self._line_no
 
     def line_pos(self):
         """Return the line postion of the violation."""
@@ -1,18 +1,98 @@
 """Defines the linter class."""
 
+import mmap
 import os
+import re
 import time
-from collections import namedtuple
+from collections import Counter, deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
 import logging
 
 # Attempt to use the C version for a speedup on comparisons
-# if it's present. If not just use the normal one.
+# if it's present. If not, use the pure python one, with a patched
+# find_longest_match (see below). NB: This is only used as a
+# fallback differ - see `_diff_opcodes` below.
 try:
     from cdifflib import CSequenceMatcher as SequenceMatcher
 except ImportError:
-    from difflib import SequenceMatcher
+    import difflib
+
+    class SequenceMatcher(difflib.SequenceMatcher):
+        """A SequenceMatcher which caches filtered b2j lists.
+
+        The stock `find_longest_match` re-filters `b2j[a[i]]` against
+        the (blo, bhi) window on every outer iteration. On sequences
+        with heavily repeated elements - like the characters of a SQL
+        file - that filtering dominates. Here we cache the filtered
+        list per element on first touch (the approach of CPython
+        gh-106877), so repeat occurrences iterate a prebuilt list with
+        no range checks in the hot loop.
+        """
+
+        def find_longest_match(self, alo=0, ahi=None, blo=0, bhi=None):
+            """Find longest matching block in a[alo:ahi] and b[blo:bhi]."""
+            a, b, b2j = self.a, self.b, self.b2j
+            if ahi is None:
+                ahi = len(a)
+            if bhi is None:
+                bhi = len(b)
+            isbjunk = self.bjunk.__contains__
+            besti, bestj, bestsize = alo, blo, 0
+            j2len = {}
+            nothing = []
+            # Cache of j-lists already filtered to the (blo, bhi) window.
+            windowed = {}
+            for i in range(alo, ahi):
+                elt = a[i]
+                js = windowed.get(elt)
+                if js is None:
+                    js = windowed[elt] = [
+                        j for j in b2j.get(elt, nothing) if blo <= j < bhi
+                    ]
+                j2lenget = j2len.get
+                newj2len = {}
+                for j in js:
+                    k = newj2len[j] = j2lenget(j - 1, 0) + 1
+                    if k > bestsize:
+                        besti, bestj, bestsize = i - k + 1, j - k + 1, k
+                j2len = newj2len
+
+            # Extend the best by non-junk and then junk elements on
+            # each end, exactly as the stock implementation does.
+            while (
+                besti > alo
+                and bestj > blo
+                and not isbjunk(b[bestj - 1])
+                and a[besti - 1] == b[bestj - 1]
+            ):
+                besti, bestj, bestsize = besti - 1, bestj - 1, bestsize + 1
+            while (
+                besti + bestsize < ahi
+                and bestj + bestsize < bhi
+                and not isbjunk(b[bestj + bestsize])
+                and a[besti + bestsize] == b[bestj + bestsize]
+            ):
+                bestsize += 1
+            while (
+                besti > alo
+                and bestj > blo
+                and isbjunk(b[bestj - 1])
+                and a[besti - 1] == b[bestj - 1]
+            ):
+                besti, bestj, bestsize = besti - 1, bestj - 1, bestsize + 1
+            while (
+                besti + bestsize < ahi
+                and bestj + bestsize < bhi
+                and isbjunk(b[bestj + bestsize])
+                and a[besti + bestsize] == b[bestj + bestsize]
+            ):
+                bestsize += 1
+            return difflib.Match(besti, bestj, bestsize)
+
+from .diff import myers_line_opcodes
 
-from benchit import BenchIt
 import pathspec
 
 from .errors import SQLLexError, SQLParseError
@@ -25,6 +105,139 @@ from .config import FluffConfig
 linter_logger = logging.getLogger("sqlfluff.linter")
 
 
+class _NoOpBencher:
+    """A falsy stand-in for BenchIt which does nothing when called."""
+
+    def __call__(self, *args):
+        return None
+
+    def __bool__(self):
+        return False
+
+
+_noop_bencher = _NoOpBencher()
+
+
+def get_bencher():
+    """Get a benchmarking callable for marking progress events.
+
+    BenchIt does a `time.monotonic` call and some bookkeeping on every
+    event, so unless benchmarking has been explicitly requested (via
+    the SQLFLUFF_BENCHMARK environment variable) we hand back a falsy
+    no-op instead - and avoid importing benchit at all. Callers can
+    guard expensive message construction with `if bencher:`.
+    """
+    if "SQLFLUFF_BENCHMARK" in os.environ:
+        from benchit import BenchIt
+
+        return BenchIt()
+    return _noop_bencher
+
+
+# Feature flag to fall back to difflib (or cdifflib if installed)
+# rather than the Myers differ for merging fixes back into files.
+_USE_DIFFLIB = "SQLFLUFF_DIFFLIB" in os.environ
+
+
+def _frozen_config_section(section):
+    """Recursively convert a config section into a hashable value."""
+    if isinstance(section, dict):
+        return tuple(
+            (k, _frozen_config_section(v)) for k, v in sorted(section.items())
+        )
+    elif isinstance(section, list):
+        return tuple(_frozen_config_section(elem) for elem in section)
+    return section
+
+
+@lru_cache(maxsize=None)
+def _load_pathspec(ignore_path):
+    """Read and compile an ignore file, cached on its path.
+
+    An ignore file applies to every file beneath it, so within a run we
+    only want to parse and compile each one once - repeat walks (e.g.
+    several user-supplied paths sharing a tree) then hit the cache. The
+    cache lives for the process, which is fine for a CLI invocation.
+    """
+    with open(ignore_path, "r") as fh:
+        return pathspec.PathSpec.from_lines("gitwildmatch", fh)
+
+
+# Matches well-formed 'noqa' or 'noqa: <rule>[,...]' ignore directives.
+# Precompiled so that per-comment parsing is a single C-level match.
+_NOQA_RE = re.compile(r"noqa(?::(?P<rules>.*))?$")
+
+# Used for inverting opcodes when a diff is computed with the
+# sequences in swapped roles.
+_OPPOSITE_TAG = {
+    "equal": "equal",
+    "replace": "replace",
+    "insert": "delete",
+    "delete": "insert",
+}
+
+
+def _diff_opcode_pair(raw, templ, fixed):
+    """Get difflib-style opcodes for the raw->templ and templ->fixed diffs.
+
+    By default this uses the Myers differ, diffing by lines first and
+    refining any changed regions by character. It runs in time
+    proportional to the size of the *difference* between the two
+    strings - usually small when merging fixes - rather than
+    `difflib.SequenceMatcher` which degrades badly on long strings
+    with a small alphabet (i.e. character diffs of SQL files).
+
+    If either pair of strings is identical we skip that diff entirely
+    and synthesise a single equal opcode. In the difflib fallback mode,
+    both diffs share one SequenceMatcher with the templated file pinned
+    as seq2 - building the b2j index for seq2 is the expensive part and
+    the templated file is common to both diffs - so the second diff is
+    computed with the roles swapped and its opcodes inverted.
+    """
+    if _USE_DIFFLIB:
+        # SequenceMatcher hashes every element, and hashing the small
+        # ints of a bytes object is markedly cheaper than hashing str
+        # characters. For pure-ASCII content the byte offsets are
+        # identical to the character offsets, so we can diff the
+        # encoded versions and use the opcodes unchanged. Non-ASCII
+        # files stay in str mode.
+        try:
+            raw, templ, fixed = (
+                raw.encode("ascii"),
+                templ.encode("ascii"),
+                fixed.encode("ascii"),
+            )
+        except UnicodeEncodeError:
+            pass
+
+    matcher = None
+    if raw == templ:
+        templ_codes = [("equal", 0, len(raw), 0, len(templ))]
+    elif _USE_DIFFLIB:
+        matcher = SequenceMatcher(autojunk=None)
+        matcher.set_seq2(templ)
+        matcher.set_seq1(raw)
+        templ_codes = matcher.get_opcodes()
+    else:
+        templ_codes = myers_line_opcodes(raw, templ)
+
+    if templ == fixed:
+        fix_codes = [("equal", 0, len(templ), 0, len(fixed))]
+    elif matcher:
+        # Reuse the existing matcher, keeping templ as seq2 and
+        # inverting the resulting opcodes.
+        matcher.set_seq1(fixed)
+        fix_codes = [
+            (_OPPOSITE_TAG[tag], j1, j2, i1, i2)
+            for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+        ]
+    elif _USE_DIFFLIB:
+        fix_codes = SequenceMatcher(autojunk=None, a=templ, b=fixed).get_opcodes()
+    else:
+        fix_codes = myers_line_opcodes(templ, fixed)
+    return templ_codes, fix_codes
+
+
 class LintedFile(
     namedtuple(
         "ProtoFile",
@@ -55,39 +268,53 @@ class LintedFile(
 
         Optionally now with filters.
         """
-        violations = self.violations
-        # Filter types
+        # Normalise the filters up front so that the filtering below is
+        # a single pass over the violations.
         if types:
             try:
                 types = tuple(types)
             except TypeError:
                 types = (types,)
-            violations = [v for v in violations if isinstance(v, types)]
-        # Filter rules
         if rules:
             if isinstance(rules, str):
-                rules = (rules,)
+                rules = frozenset((rules,))
             else:
-                rules = tuple(rules)
-            violations = [v for v in violations if v.rule_code() in rules]
-        # Filter fixable
-        if fixable is not None:
-            # Assume that fixable is true or false if not None
-            violations = [v for v in violations if v.fixable is fixable]
-        # Filter ignorable violations
-        if filter_ignore:
-            violations = [v for v in violations if not v.ignore]
-            # Ignore any rules in the ignore mask
-            if self.ignore_mask:
-                for line_no, rules in self.ignore_mask:
-                    violations = [
-                        v
-                        for v in violations
-                        if not (
-                            v.line_no() == line_no
-                            and (rules is None or v.rule_code() in rules)
+                rules = frozenset(rules)
+        # Collapse the ignore mask into a dict of line_no -> rules,
+        # where None means ignore everything on that line.
+        ignore_mask = {}
+        if filter_ignore and self.ignore_mask:
+            for line_no, ignore_rules in self.ignore_mask:
+                if ignore_rules is None:
+                    ignore_mask[line_no] = None
+                elif line_no in ignore_mask:
+                    if ignore_mask[line_no] is not None:
+                        ignore_mask[line_no] = ignore_mask[line_no] | frozenset(
+                            ignore_rules
                         )
-                    ]
+                else:
+                    ignore_mask[line_no] = frozenset(ignore_rules)
+
+        violations = []
+        for v in self.violations:
+            if types and not isinstance(v, types):
+                continue
+            if rules and v.rule_code() not in rules:
+                continue
+            # Assume that fixable is true or false if not None
+            if fixable is not None and v.fixable is not fixable:
+                continue
+            if filter_ignore:
+                if v.ignore:
+                    continue
+                # Ignore any rules in the ignore mask
+                if ignore_mask:
+                    masked_rules = ignore_mask.get(v.line_no(), False)
+                    if masked_rules is None or (
+                        masked_rules and v.rule_code() in masked_rules
+                    ):
+                        continue
+            violations.append(v)
         return violations
 
     def num_violations(self, **kwargs):
@@ -115,7 +342,7 @@ class LintedFile(
         It returns a list of tuples ('equal|replace|delete|insert', ia1, ia2, ib1, ib2).
 
         """
-        bencher = BenchIt()
+        bencher = get_bencher()
         bencher("fix_string: start")
 
         # Do we have enough information to actually fix the file?
@@ -126,59 +353,86 @@ class LintedFile(
             return None, False
 
         linter_logger.info("Persisting file masks: %s", self.file_mask)
-        # Compare Templated with Raw
-        diff_templ = SequenceMatcher(
-            autojunk=None, a=self.file_mask[0], b=self.file_mask[1]
-        )
-        bencher("fix_string: Match 0&1")
-        diff_templ_codes = diff_templ.get_opcodes()
-        linter_logger.debug("Templater diff codes: %s", diff_templ_codes)
-
-        bencher("fix_string: Got Opcodes 0&1")
-        # Compare Fixed with Templated
-        diff_fix = SequenceMatcher(
-            autojunk=None, a=self.file_mask[1], b=self.file_mask[2]
-        )
-        bencher("fix_string: Matched 1&2")
-        # diff_fix = SequenceMatcher(autojunk=None, a=self.file_mask[1][0], b=self.file_mask[2][0])
-        diff_fix_codes = diff_fix.get_opcodes()
-        linter_logger.debug("Fixing diff codes: %s", diff_fix_codes)
-        bencher("fix_string: Got Opcodes 1&2")
+
+        # If no fixes were applied, then - regardless of templating - the
+        # raw file is already the answer. This is the common case when
+        # linting without --fix (or when --fix found nothing to do) and
+        # means we can skip both diffs and the merge loop entirely.
+        if self.file_mask[1] == self.file_mask[2]:
+            return self.file_mask[0], False
+
+        # Symmetrically, if no templating happened then there are no
+        # templated sections to protect and the fixed version can be
+        # returned directly. NB: We know the fixes changed something
+        # because of the check above.
+        if self.file_mask[0] == self.file_mask[1]:
+            return self.file_mask[2], True
+
+        # Compare Templated with Raw, and Fixed with Templated. Identical
+        # pairs are short-circuited inside the helper.
+        diff_templ_codes, diff_fix_codes = _diff_opcode_pair(*self.file_mask)
+        # Hoist the debug check: the loop below logs per iteration and
+        # even a disabled debug call costs a dispatch and an arg tuple.
+        debug = linter_logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            linter_logger.debug("Templater diff codes: %s", diff_templ_codes)
+            linter_logger.debug("Fixing diff codes: %s", diff_fix_codes)
+        bencher("fix_string: Got Opcodes")
 
         # If diff_templ isn't the same then we should just keep the template. If there *was*
         # a fix in that space, then we should raise an issue
         # If it is the same, then we can apply fixes as expected.
-        write_buff = ""
+        # Bind the file mask entries to locals. The merge loop below is
+        # interpreter-bound, so trimming the repeated attribute and index
+        # lookups is worthwhile.
+        raw_file, templ_file, fixed_file = self.file_mask
+        # Buffer of string fragments, joined on return. Appending to a
+        # list is O(1) where repeated string concatenation is O(n).
+        write_buff = []
         fixed_block = None
         templ_block = None
-        # index in raw, templ and fix
-        idx = (0, 0, 0)
+        # Cursors into the opcode lists. We consume blocks by advancing
+        # these rather than popping from the front of the lists (which
+        # is O(n) a time).
+        templ_idx = 0
+        fix_idx = 0
+        n_templ_codes = len(diff_templ_codes)
+        n_fix_codes = len(diff_fix_codes)
+        # indexes in raw, templ and fix. Kept as three local ints
+        # rather than a tuple so advancing them doesn't allocate.
+        raw_idx = templ_pos = fix_pos = 0
         loop_idx = 0
         bencher("fix_string: Loop Setup")
         while True:
             loop_idx += 1
-            linter_logger.debug(
-                "%04d: Write Loop: idx:%s, buff:%r", loop_idx, idx, write_buff
-            )
+            if debug:
+                linter_logger.debug(
+                    "%04d: Write Loop: idx:%s, buff:%r",
+                    loop_idx,
+                    (raw_idx, templ_pos, fix_pos),
+                    write_buff,
+                )
             if templ_block is None:
-                if diff_templ_codes:
-                    templ_block = diff_templ_codes.pop(0)
+                if templ_idx < n_templ_codes:
+                    templ_block = diff_templ_codes[templ_idx]
+                    templ_idx += 1
                 # We've exhausted the template. Have we exhausted the fixes?
-                elif fixed_block is None and not diff_fix_codes:
+                elif fixed_block is None and fix_idx >= n_fix_codes:
                     # Yes - excellent. DONE
                     break
                 # Deal with the case that we only have inserts left.
-                elif all(elem[0] == "insert" for elem in diff_fix_codes):
-                    for fixed_block in diff_fix_codes:
-                        write_buff += self.file_mask[2][fixed_block[3] : fixed_block[4]]
+                elif all(elem[0] == "insert" for elem in diff_fix_codes[fix_idx:]):
+                    for fixed_block in diff_fix_codes[fix_idx:]:
+                        write_buff.append(fixed_file[fixed_block[3] : fixed_block[4]])
                     break
                 else:
                     raise NotImplementedError(
                         "Fix Block(s) left over! Don't know how to handle this! aeflf8wh"
                     )
             if fixed_block is None:
-                if diff_fix_codes:
-                    fixed_block = diff_fix_codes.pop(0)
+                if fix_idx < n_fix_codes:
+                    fixed_block = diff_fix_codes[fix_idx]
+                    fix_idx += 1
                 elif templ_block[0] != "delete":
                     # We need another fixed_block for the cases where templ_block[0] is not 'delete'
                     raise NotImplementedError(
@@ -187,43 +441,50 @@ class LintedFile(
                         )
                     )
 
-            linter_logger.debug(
-                "%04d: Blocks: template:%s, fix:%s", loop_idx, templ_block, fixed_block
-            )
+            if debug:
+                linter_logger.debug(
+                    "%04d: Blocks: template:%s, fix:%s",
+                    loop_idx,
+                    templ_block,
+                    fixed_block,
+                )
             if templ_block[0] == "equal":
                 if fixed_block[0] == "equal":
                     # No templating, no fixes, go with middle and advance indexes
                     # Find out how far we can advance (we use the middle version because it's common)
                     if templ_block[4] == fixed_block[2]:
-                        buff = self.file_mask[1][idx[1] : fixed_block[2]]
+                        advance_to = fixed_block[2]
                         # consume both blocks
                         fixed_block = None
                         templ_block = None
                     elif templ_block[4] > fixed_block[2]:
-                        buff = self.file_mask[1][idx[1] : fixed_block[2]]
+                        advance_to = fixed_block[2]
                         # consume fixed block
                         fixed_block = None
                     elif templ_block[4] < fixed_block[2]:
-                        buff = self.file_mask[1][idx[1] : templ_block[4]]
+                        advance_to = templ_block[4]
                         # consume templ block
                         templ_block = None
-                    idx = (idx[0] + len(buff), idx[1] + len(buff), idx[2] + len(buff))
-                    write_buff += buff
+                    # NB: Compute the length from the indexes rather than
+                    # the slice, so we only materialise one string copy.
+                    advance_len = advance_to - templ_pos
+                    write_buff.append(templ_file[templ_pos:advance_to])
+                    raw_idx += advance_len
+                    templ_pos = advance_to
+                    fix_pos += advance_len
                     continue
                 elif fixed_block[0] == "replace":
                     # Consider how to apply fixes.
                     # Can we implement the fix while staying in the equal segment?
                     if fixed_block[2] <= templ_block[4]:
                         # Yes! Write from the fixed version.
-                        write_buff += self.file_mask[2][idx[2] : fixed_block[4]]
-                        idx = (
-                            idx[0] + (fixed_block[2] - fixed_block[1]),
-                            fixed_block[2],
-                            fixed_block[4],
-                        )
+                        write_buff.append(fixed_file[fix_pos : fixed_block[4]])
+                        raw_idx += fixed_block[2] - fixed_block[1]
+                        templ_pos = fixed_block[2]
+                        fix_pos = fixed_block[4]
                         # Consume the fixed block because we've written the whole thing.
                         fixed_block = None
-                        if not diff_templ_codes and not diff_fix_codes:
+                        if templ_idx >= n_templ_codes and fix_idx >= n_fix_codes:
                             # If we just just used the last fixed_block and were using the last templ_block
                             # then consume the templ_block
                             templ_block = None
@@ -233,16 +494,14 @@ class LintedFile(
                 elif fixed_block[0] == "delete":
                     # We're deleting items, nothing to write but we can consume some
                     # blocks and advance some indexes.
-                    idx = (
-                        idx[0] + (fixed_block[2] - fixed_block[1]),
-                        fixed_block[2],
-                        fixed_block[4],
-                    )
+                    raw_idx += fixed_block[2] - fixed_block[1]
+                    templ_pos = fixed_block[2]
+                    fix_pos = fixed_block[4]
                     fixed_block = None
                 elif fixed_block[0] == "insert":
                     # We're inserting items, Write from the fix block, but only that index moves.
-                    write_buff += self.file_mask[2][idx[2] : fixed_block[4]]
-                    idx = (idx[0], idx[1], fixed_block[4])
+                    write_buff.append(fixed_file[fix_pos : fixed_block[4]])
+                    fix_pos = fixed_block[4]
                     fixed_block = None
                 else:
                     raise NotImplementedError(
@@ -256,7 +515,7 @@ class LintedFile(
                 # We're in a templated section - we should write the templated version.
                 # we should consume the whole replace block and then deal with where
                 # we end up.
-                buff = self.file_mask[0][idx[0] : templ_block[2]]
+                buff = raw_file[raw_idx : templ_block[2]]
                 new_templ_idx = templ_block[4]
 
                 # Fast forward through fix blocks until we catch up. We're not implementing
@@ -271,8 +530,9 @@ class LintedFile(
                             linter_logger.warning(
                                 "Skipping edit block: {0}".format(fixed_block)
                             )
-                        if diff_fix_codes:
-                            fixed_block = diff_fix_codes.pop(0)
+                        if fix_idx < n_fix_codes:
+                            fixed_block = diff_fix_codes[fix_idx]
+                            fix_idx += 1
                         else:
                             raise NotImplementedError(
                                 "Unexpectedly depleted the fixes. Panic!"
@@ -280,15 +540,15 @@ class LintedFile(
                 # Are we exactly on a join?
                 if new_templ_idx == fixed_block[1]:
                     # GREAT - this makes things easy because we have an equality point already
-                    idx = (templ_block[2], new_templ_idx, fixed_block[3])
+                    raw_idx = templ_block[2]
+                    templ_pos = new_templ_idx
+                    fix_pos = fixed_block[3]
                 else:
                     if fixed_block[0] == "equal":
                         # If it's in an equal block, we can use the same offset from the end.
-                        idx = (
-                            templ_block[2],
-                            new_templ_idx,
-                            fixed_block[3] + (new_templ_idx - fixed_block[1]),
-                        )
+                        raw_idx = templ_block[2]
+                        templ_pos = new_templ_idx
+                        fix_pos = fixed_block[3] + (new_templ_idx - fixed_block[1])
                     else:
                         # TODO: We're trying to move through an templated section, but end up
                         # in a fixed section. We've lost track of indexes.
@@ -299,7 +559,7 @@ class LintedFile(
                         raise NotImplementedError(
                             "PANIC. Index position confused. Report this error."
                         )
-                write_buff += buff
+                write_buff.append(buff)
                 # consume template block
                 templ_block = None
             elif templ_block[0] == "delete":
@@ -307,11 +567,10 @@ class LintedFile(
                 # some characters. This is just a quirk of the differ.
                 # In reality this means we just write these characters
                 # and don't worry about advancing the other indexes.
-                buff = self.file_mask[0][idx[0] : templ_block[2]]
+                write_buff.append(raw_file[raw_idx : templ_block[2]])
+                raw_idx = templ_block[2]
                 # consume templ block
                 templ_block = None
-                idx = (idx[0] + len(buff), idx[1], idx[2])
-                write_buff += buff
             elif templ_block[0] == "insert":
                 # The templater has inserted something here. We don't need
                 # to write anything here (because whatever we're looking at
@@ -327,7 +586,8 @@ class LintedFile(
                     # templ block and not get to the end of the fix block.
                     if templ_block[4] <= fixed_block[2]:
                         insert_len = templ_block[4] - templ_block[3]
-                        idx = (idx[0], idx[1] + insert_len, idx[2] + insert_len)
+                        templ_pos += insert_len
+                        fix_pos += insert_len
                         # if things matched up perfectly, consume the fixed block
                         if templ_block[4] == fixed_block[2]:
                             fixed_block = None
@@ -359,8 +619,9 @@ class LintedFile(
                 )
 
         bencher("fix_string: Fixing loop done")
+        fixed_string = "".join(write_buff)
         # The success metric here is whether anything ACTUALLY changed.
-        return write_buff, write_buff != self.file_mask[0]
+        return fixed_string, fixed_string != raw_file
 
     def persist_tree(self, suffix=""):
         """Persist changes to the given path.
@@ -409,10 +670,9 @@ class LintedPath:
         if by_path:
             return {file.path: file.check_tuples() for file in self.files}
         else:
-            tuple_buffer = []
-            for file in self.files:
-                tuple_buffer += file.check_tuples()
-            return tuple_buffer
+            return list(
+                chain.from_iterable(file.check_tuples() for file in self.files)
+            )
 
     def num_violations(self, **kwargs):
         """Count the number of violations in the path."""
@@ -420,10 +680,9 @@ class LintedPath:
 
     def get_violations(self, **kwargs):
         """Return a list of violations in the path."""
-        buff = []
-        for file in self.files:
-            buff += file.get_violations(**kwargs)
-        return buff
+        return list(
+            chain.from_iterable(file.get_violations(**kwargs) for file in self.files)
+        )
 
     def violation_dict(self, **kwargs):
         """Return a dict of violations by file path."""
@@ -431,12 +690,17 @@ class LintedPath:
 
     def stats(self):
         """Return a dict containing linting stats about this path."""
-        return dict(
-            files=len(self.files),
-            clean=sum(file.is_clean() for file in self.files),
-            unclean=sum(not file.is_clean() for file in self.files),
-            violations=sum(file.num_violations() for file in self.files),
-        )
+        stats = dict(files=len(self.files), clean=0, unclean=0, violations=0)
+        for file in self.files:
+            # Fetch the violations for each file just once and derive
+            # the other metrics from them.
+            violations = file.get_violations()
+            if violations:
+                stats["unclean"] += 1
+                stats["violations"] += len(violations)
+            else:
+                stats["clean"] += 1
+        return stats
 
     def persist_changes(self, formatter=None, fixed_file_suffix="", **kwargs):
         """Persist changes to files in the given path.
@@ -501,10 +765,9 @@ class LintingResult:
                 buff.update(path.check_tuples(by_path=by_path))
             return buff
         else:
-            tuple_buffer = []
-            for path in self.paths:
-                tuple_buffer += path.check_tuples()
-            return tuple_buffer
+            return list(
+                chain.from_iterable(path.check_tuples() for path in self.paths)
+            )
 
     def num_violations(self, **kwargs):
         """Count the number of violations in the result."""
@@ -512,20 +775,21 @@ class LintingResult:
 
     def get_violations(self, **kwargs):
         """Return a list of violations in the result."""
-        buff = []
-        for path in self.paths:
-            buff += path.get_violations(**kwargs)
-        return buff
+        return list(
+            chain.from_iterable(path.get_violations(**kwargs) for path in self.paths)
+        )
 
     def violation_dict(self, **kwargs):
         """Return a dict of paths and violations."""
-        return self.combine_dicts(path.violation_dict(**kwargs) for path in self.paths)
+        return self.combine_dicts(
+            *(path.violation_dict(**kwargs) for path in self.paths)
+        )
 
     def stats(self):
         """Return a stats dictionary of this result."""
-        all_stats = dict(files=0, clean=0, unclean=0, violations=0)
+        all_stats = Counter(files=0, clean=0, unclean=0, violations=0)
         for path in self.paths:
-            all_stats = self.sum_dicts(path.stats(), all_stats)
+            all_stats.update(path.stats())
         if all_stats["files"] > 0:
             all_stats["avg per file"] = (
                 all_stats["violations"] * 1.0 / all_stats["files"]
@@ -575,6 +839,11 @@ class LintingResult:
 class Linter:
     """The interface class to interact with the linter."""
 
+    # Hard cap on the number of passes of the fix loop. Each pass applies
+    # at least one fix, so hitting this implies either a very messy file
+    # or rules fighting each other.
+    MAX_FIX_ITERATIONS = 50
+
     def __init__(
         self, sql_exts=(".sql",), config=None, formatter=None, dialect=None, rules=None
     ):
@@ -597,17 +866,39 @@ class Linter:
 
         self.dialect = config.get("dialect_obj")
         self.templater = config.get("templater_obj")
-        self.sql_exts = sql_exts
+        # A tuple, so `str.endswith` can test all the extensions at once.
+        self.sql_exts = tuple(sql_exts)
         # Store the config object
         self.config = config
         # Store the formatter for output
         self.formatter = formatter
+        # Cache of instantiated rulesets, see `get_ruleset`.
+        self._rulelist_cache = {}
 
     def get_ruleset(self, config=None):
-        """Get hold of a set of rules."""
-        rs = get_ruleset()
+        """Get hold of a set of rules.
+
+        The instantiated rules depend only on the rule selection and
+        rule configuration fields of the config, so the result is
+        memoized on a key built from those - in the common case of a
+        run where every file shares a config, the rules are only
+        constructed once. Returns a tuple so that cached results can't
+        be mutated by callers.
+        """
         cfg = config or self.config
-        return rs.get_rulelist(config=cfg)
+        key = (
+            tuple(cfg.get("rule_whitelist") or ()),
+            tuple(cfg.get("rule_blacklist") or ()),
+            _frozen_config_section(cfg.get_section("rules")),
+        )
+        try:
+            return self._rulelist_cache[key]
+        except KeyError:
+            pass
+        rs = get_ruleset()
+        rulelist = tuple(rs.get_rulelist(config=cfg))
+        self._rulelist_cache[key] = rulelist
+        return rulelist
 
     def rule_tuples(self):
         """A simple pass through to access the rule tuples of the rule set."""
@@ -630,13 +921,14 @@ class Linter:
         """
         violations = []
         t0 = time.monotonic()
-        bencher = BenchIt()  # starts the timer
+        bencher = get_bencher()  # starts the timer
         if fname:
             short_fname = fname.replace("\\", "/").split("/")[-1]
         else:
             # this handles the potential case of a null fname
             short_fname = fname
-        bencher("Staring parse_string for {0!r}".format(short_fname))
+        if bencher:
+            bencher("Staring parse_string for {0!r}".format(short_fname))
 
         # Dispatch the output for the parse header (including the config diff)
         if self.formatter:
@@ -653,7 +945,8 @@ class Linter:
             file_segment = None
 
         t1 = time.monotonic()
-        bencher("Templating {0!r}".format(short_fname))
+        if bencher:
+            bencher("Templating {0!r}".format(short_fname))
 
         if s:
             linter_logger.info("LEXING RAW (%s)", fname)
@@ -670,11 +963,12 @@ class Linter:
         else:
             file_segment = None
 
-        if file_segment:
+        if file_segment and linter_logger.isEnabledFor(logging.INFO):
             linter_logger.info(file_segment.stringify())
 
         t2 = time.monotonic()
-        bencher("Lexing {0!r}".format(short_fname))
+        if bencher:
+            bencher("Lexing {0!r}".format(short_fname))
         linter_logger.info("PARSING (%s)", fname)
         # Parse the file and log any problems
         if file_segment:
@@ -688,8 +982,11 @@ class Linter:
                 violations.append(err)
                 parsed = None
             if parsed:
-                linter_logger.info("\n###\n#\n# {0}\n#\n###".format("Parsed Tree:"))
-                linter_logger.info("\n" + parsed.stringify())
+                if linter_logger.isEnabledFor(logging.INFO):
+                    linter_logger.info(
+                        "\n###\n#\n# {0}\n#\n###".format("Parsed Tree:")
+                    )
+                    linter_logger.info("\n" + parsed.stringify())
                 # We may succeed parsing, but still have unparsable segments. Extract them here.
                 for unparsable in parsed.iter_unparsables():
                     # No exception has been raised explicitly, but we still create one here
@@ -711,7 +1008,8 @@ class Linter:
 
         t3 = time.monotonic()
         time_dict = {"templating": t1 - t0, "lexing": t2 - t1, "parsing": t3 - t2}
-        bencher("Finish parsing {0!r}".format(short_fname))
+        if bencher:
+            bencher("Finish parsing {0!r}".format(short_fname))
         return parsed, violations, time_dict
 
     @staticmethod
@@ -719,20 +1017,21 @@ class Linter:
         """Extract ignore mask entries from a comment segment."""
         # Also trim any whitespace afterward
         comment_content = comment.raw_trimmed().strip()
-        if comment_content.startswith("noqa"):
-            # This is an ignore identifier
-            comment_remainder = comment_content[4:]
-            if comment_remainder:
-                if not comment_remainder.startswith(":"):
-                    return SQLParseError(
-                        "Malformed 'noqa' section. Expected 'noqa: <rule>[,...]",
-                        segment=comment,
-                    )
-                comment_remainder = comment_remainder[1:]
-                rules = [r.strip() for r in comment_remainder.split(",")]
-                return (comment.pos_marker.line_no, tuple(rules))
-            else:
+        noqa_match = _NOQA_RE.match(comment_content)
+        if noqa_match:
+            rules = noqa_match.group("rules")
+            if rules is None:
                 return (comment.pos_marker.line_no, None)
+            return (
+                comment.pos_marker.line_no,
+                tuple(r.strip() for r in rules.split(",")),
+            )
+        elif comment_content.startswith("noqa"):
+            # Anything after 'noqa' other than a colon is malformed.
+            return SQLParseError(
+                "Malformed 'noqa' section. Expected 'noqa: <rule>[,...]",
+                segment=comment,
+            )
         return None
 
     def lint_string(self, s, fname="<string input>", fix=False, config=None):
@@ -773,62 +1072,110 @@ class Linter:
             templ_buff = parsed.raw
             t0 = time.monotonic()
             linter_logger.info("LINTING (%s)", fname)
-            # Get the initial violations
-            linting_errors = []
-            for crawler in self.get_ruleset(config=config):
+            # Fetch the ruleset once for the file - constructing the
+            # crawlers involves re-reading config, so we don't want to
+            # repeat it on every pass of the fix loop. NB: `list` to pin
+            # the rule ordering, which is deterministic and matters.
+            ruleset = list(self.get_ruleset(config=config))
+            # Get the initial violations. Collect each crawler's errors
+            # as a chunk and flatten once at the end, rather than paying
+            # for repeated list extension.
+            # NB: Each crawl is independent, but don't be tempted to
+            # farm them out: the crawls are pure python (so threads
+            # serialize on the GIL) and parse trees are built from
+            # dynamically generated segment classes (so they can't be
+            # pickled to a process pool).
+            lerr_chunks = []
+            for crawler in ruleset:
                 lerrs, _, _, _ = crawler.crawl(
                     parsed, dialect=config.get("dialect_obj")
                 )
-                linting_errors += lerrs
-            initial_linting_errors = linting_errors
+                lerr_chunks.append(lerrs)
+            initial_linting_errors = list(chain.from_iterable(lerr_chunks))
 
             # If we're in fix mode, iteratively apply fixes until done, or we can't make a move.
             if fix:
                 # If we're in fix mode, then we need to progressively call and reconstruct
                 working = parsed
-                # Keep a set of previous versions to catch infinite loops.
-                previous_versions = {working.raw}
-                linting_errors = []
-                last_fixes = None
+                # Carry the materialized raw string alongside the tree -
+                # `.raw` walks and joins the whole tree each time it's
+                # accessed, so we only want to pay for it once per version.
+                working_raw = templ_buff
+                # Keep hashes of previous versions to catch infinite loops.
+                # Hashes rather than the strings themselves, so the memory
+                # footprint doesn't scale with file size.
+                seen_hashes = {hash(working_raw)}
+                last_fixes_sig = None
                 fix_loop_idx = 0
-                loop_limit = 20
+                # Track which version of the tree each crawler last ran
+                # against, so we can skip re-crawling rules whose input
+                # hasn't changed since their last pass.
+                tree_version = 0
+                last_crawled = {}
                 while True:
                     fix_loop_idx += 1
-                    if fix_loop_idx > loop_limit:
+                    if fix_loop_idx > self.MAX_FIX_ITERATIONS:
                         linter_logger.warning(
                             "Loop limit on fixes reached [%s]. Some fixes may be overdone.",
-                            loop_limit,
+                            self.MAX_FIX_ITERATIONS,
                         )
                         break
                     changed = False
-                    for crawler in self.get_ruleset(config=config):
+                    for crawler in ruleset:
                         # fixes should be a dict {} with keys edit, delete, create
                         # delete is just a list of segments to delete
                         # edit and create are list of tuples. The first element is the
                         # "anchor", the segment to look for either to edit or to insert BEFORE.
                         # The second is the element to insert or create.
 
-                        lerrs, _, fixes, _ = crawler.crawl(
+                        if last_crawled.get(crawler.code) == tree_version:
+                            # This crawler has already run against this exact
+                            # version of the tree (i.e. it ran after the last
+                            # applied fix), so its result hasn't changed.
+                            continue
+
+                        # NB: The crawl errors are deliberately discarded
+                        # here - we only ever report the *initial* errors,
+                        # and partial passes would duplicate them anyway.
+                        _, _, fixes, _ = crawler.crawl(
                             working, dialect=config.get("dialect_obj"), fix=True
                         )
-                        linting_errors += lerrs
+                        # Record the version we crawled *before* any fixes
+                        # are applied - an applied fix bumps the version.
+                        last_crawled[crawler.code] = tree_version
                         if fixes:
                             linter_logger.info("Applying Fixes: %s", fixes)
 
-                            if last_fixes and fixes == last_fixes:
+                            # A cheap signature of the proposed fixes, so
+                            # that spotting a repeat proposal doesn't need
+                            # a structural comparison of segments.
+                            fixes_sig = tuple(
+                                (id(f.anchor), f.edit_type, getattr(f.edit, "raw", None))
+                                for f in fixes
+                            )
+                            if fixes_sig == last_fixes_sig:
                                 linter_logger.warning(
                                     "One fix for %s not applied, it would re-cause the same error.",
                                     crawler.code,
                                 )
                             else:
-                                last_fixes = fixes
+                                last_fixes_sig = fixes_sig
                                 new_working, fixes = working.apply_fixes(fixes)
 
                                 # Check for infinite loops
-                                if new_working.raw not in previous_versions:
+                                new_raw = new_working.raw
+                                new_hash = hash(new_raw)
+                                if new_hash not in seen_hashes:
                                     working = new_working
-                                    previous_versions.add(working.raw)
+                                    working_raw = new_raw
+                                    seen_hashes.add(new_hash)
+                                    tree_version += 1
                                     changed = True
+                                    # The tree just mutated, so anything the
+                                    # remaining crawlers would tell us about
+                                    # it is already stale. Restart the pass
+                                    # against the fresh tree instead.
+                                    break
                                 else:
                                     linter_logger.warning(
                                         "One fix for %s not applied, it would re-cause the same error.",
@@ -839,6 +1186,10 @@ class Linter:
                         break
                 # Set things up to return the altered version
                 parsed = working
+                fixed_buff = working_raw
+            else:
+                # Without fixes the tree is unchanged from templating.
+                fixed_buff = templ_buff
 
             # Update the timing dict
             t1 = time.monotonic()
@@ -846,13 +1197,17 @@ class Linter:
 
             # We're only going to return the *initial* errors, rather
             # than any generated during the fixing cycle.
-            vs += initial_linting_errors
-            fixed_buff = parsed.raw
+            vs.extend(initial_linting_errors)
 
         # We process the ignore config here if appropriate
         if config:
-            for violation in vs:
-                violation.ignore_if_in(config.get("ignore"))
+            ignore_config = config.get("ignore")
+            # NB: A bare string isn't a valid ignore specification, only
+            # an iterable of identifiers - mirroring `ignore_if_in`.
+            if ignore_config and not isinstance(ignore_config, str):
+                ignored = frozenset(ignore_config)
+                for violation in vs:
+                    violation.ignore_if_in(ignored)
 
         file_mask = (raw_buff, templ_buff, fixed_buff)
         linted_file = LintedFile(
@@ -893,39 +1248,65 @@ class Linter:
             return [path]
 
         # If it's a directory then expand the path!
-        ignore_set = set()
-        buffer = []
-        for dirpath, _, filenames in os.walk(path):
-            for fname in filenames:
-                fpath = os.path.join(dirpath, fname)
-                # Handle potential .sqlfluffignore files
-                if fname == ignore_file_name:
-                    with open(fpath, "r") as fh:
-                        spec = pathspec.PathSpec.from_lines("gitwildmatch", fh)
-                    matches = spec.match_tree(dirpath)
-                    for m in matches:
-                        ignore_path = os.path.join(dirpath, m)
-                        ignore_set.add(ignore_path)
-                    # We don't need to process the ignore file any futher
-                    continue
-
-                # We won't purge files *here* because there's an edge case
-                # that the ignore file is processed after the sql file.
+        return sorted(
+            os.path.normpath(fpath)
+            for fpath in self._walk_sql_paths(path, ignore_file_name, [])
+        )
 
-                # Scan for remaining files
-                for ext in self.sql_exts:
-                    # is it a sql file?
-                    if fname.endswith(ext):
-                        buffer.append(fpath)
+    def _walk_sql_paths(self, dirpath, ignore_file_name, ignore_specs):
+        """Recursively yield paths of sql files found under a directory.
 
-        # Check the buffer for ignore items and normalise the rest.
-        filtered_buffer = []
-        for fpath in buffer:
-            if fpath not in ignore_set:
-                filtered_buffer.append(os.path.normpath(fpath))
+        Each directory is scanned exactly once (via :func:`os.scandir`).
+        Any ignore file found in the listing is compiled before the
+        entries are processed - it applies to its siblings - and the
+        accumulated stack of (root, spec) pairs is carried down the
+        recursion, so nested ignore files stack without re-walking
+        their subtrees.
+        """
+        # Detect any local ignore file while reading the directory, so
+        # the listing is only traversed once. It has to be compiled
+        # before the other entries are processed - it applies to them.
+        ignore_entry_path = None
+        entries = []
+        with os.scandir(dirpath) as entry_iter:
+            for entry in entry_iter:
+                if entry.name == ignore_file_name:
+                    ignore_entry_path = entry.path
+                else:
+                    entries.append(entry)
+        if ignore_entry_path:
+            ignore_specs = ignore_specs + [
+                (dirpath, _load_pathspec(ignore_entry_path))
+            ]
+        for entry in entries:
+            # NB: Checking file-ness *without* following symlinks, to
+            # match the previous `os.walk` behaviour of not recursing
+            # into linked directories - and to avoid an extra stat call.
+            if entry.is_dir(follow_symlinks=False):
+                # Prune ignored directories rather than recursing into
+                # them and discarding their files one by one afterward.
+                if self._path_is_ignored(entry.path, ignore_specs, is_dir=True):
+                    continue
+                yield from self._walk_sql_paths(
+                    entry.path, ignore_file_name, ignore_specs
+                )
+            elif entry.is_file() and entry.name.endswith(self.sql_exts):
+                # It's a sql file.
+                if not self._path_is_ignored(entry.path, ignore_specs):
+                    yield entry.path
 
-        # Return
-        return sorted(filtered_buffer)
+    @staticmethod
+    def _path_is_ignored(fpath, ignore_specs, is_dir=False):
+        """Check a path against a stack of (root, spec) ignore pairs."""
+        for root, spec in ignore_specs:
+            rel_path = os.path.relpath(fpath, root)
+            if is_dir:
+                # A trailing slash so that gitwildmatch treats it as a
+                # directory and directory patterns (e.g. `foo/`) match.
+                rel_path += "/"
+            if spec.match_file(rel_path):
+                return True
+        return False
 
     def lint_string_wrapped(self, string, fname="<string input>", fix=False):
         """Lint strings directly."""
@@ -935,29 +1316,118 @@ class Linter:
         result.add(linted_path)
         return result
 
-    def lint_path(self, path, fix=False, ignore_non_existent_files=False):
-        """Lint a path."""
+    def lint_file(self, fname, fix=False):
+        """Lint a single file from its path, handling config and IO.
+
+        This is the unit of work for each file in `lint_path`. NB: Files
+        are currently processed serially. Farming this method out to a
+        process pool doesn't work in the current architecture because
+        segment classes are generated dynamically (e.g. via `.make()`),
+        so neither configs nor parse trees survive pickling.
+
+        Returns:
+            :obj:`LintedFile`: an object representing that linted file.
+
+        """
+        config = self.config.make_child_from_path(fname)
+        return self.lint_string(
+            self._read_file(fname), fname=fname, fix=fix, config=config
+        )
+
+    # Files at least this large are memory mapped rather than read, see
+    # `_read_file`.
+    MMAP_MIN_SIZE = 256 * 1024
+
+    @classmethod
+    def _read_file(cls, fname):
+        """Read the contents of a file, handling unicode issues gracefully.
+
+        Large files are memory mapped instead of read through the text
+        layer, so their bytes reach the decoder in one go without the
+        buffered-read copies - and the pages stay shared with the OS
+        cache rather than being duplicated per read.
+        """
+        if os.path.getsize(fname) >= cls.MMAP_MIN_SIZE:
+            with open(fname, "rb") as target_file:
+                mm = mmap.mmap(target_file.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    raw = mm[:].decode("utf8", errors="backslashreplace")
+                finally:
+                    mm.close()
+            # Replicate the universal newline translation which reading
+            # in text mode would otherwise have done for us.
+            if "\r" in raw:
+                raw = raw.replace("\r\n", "\n").replace("\r", "\n")
+            return raw
+        with open(
+            fname, "r", encoding="utf8", errors="backslashreplace"
+        ) as target_file:
+            return target_file.read()
+
+    def _load_file(self, fname):
+        """Load a file and its config, ready for linting.
+
+        This runs on the read-ahead pool: both the file read and the
+        config discovery (which probes the filesystem for config files
+        on the way to the target) are IO bound, so doing them together
+        off the main thread overlaps both with parsing.
+        """
+        return self.config.make_child_from_path(fname), self._read_file(fname)
+
+    def lint_path(self, path, fix=False, ignore_non_existent_files=False, parallel=1):
+        """Lint a path.
+
+        If `parallel` is greater than one, files are linted on a thread
+        pool of that size. NB: This uses threads rather than processes
+        because parse trees aren't picklable (see `lint_file`), so the
+        gains are limited to overlapping file IO with parsing. In
+        parallel mode, results are collected in path order but any
+        formatter output may interleave between files.
+        """
         linted_path = LintedPath(path)
         if self.formatter:
             self.formatter.dispatch_path(path)
-        for fname in self.paths_from_path(
+        fnames = self.paths_from_path(
             path, ignore_non_existent_files=ignore_non_existent_files
-        ):
-            config = self.config.make_child_from_path(fname)
-            # Handle unicode issues gracefully
-            with open(
-                fname, "r", encoding="utf8", errors="backslashreplace"
-            ) as target_file:
-                linted_path.add(
-                    self.lint_string(
-                        target_file.read(), fname=fname, fix=fix, config=config
+        )
+        if parallel > 1:
+            with ThreadPoolExecutor(max_workers=parallel) as pool:
+                for linted_file in pool.map(
+                    lambda fname: self.lint_file(fname, fix=fix), fnames
+                ):
+                    linted_path.add(linted_file)
+        else:
+            # Even single threaded, pre-read upcoming files on a small
+            # pool so the disk latency of the next file is hidden behind
+            # parsing of the current one. Reading releases the GIL, and
+            # the read-ahead window is bounded so we never hold more
+            # than a handful of files in memory at once.
+            read_ahead = 8
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                fname_iter = iter(fnames)
+                pending = deque()
+                for fname in fname_iter:
+                    pending.append((fname, pool.submit(self._load_file, fname)))
+                    if len(pending) >= read_ahead:
+                        break
+                while pending:
+                    fname, pre_read = pending.popleft()
+                    next_fname = next(fname_iter, None)
+                    if next_fname is not None:
+                        pending.append(
+                            (next_fname, pool.submit(self._load_file, next_fname))
+                        )
+                    config, raw = pre_read.result()
+                    linted_path.add(
+                        self.lint_string(raw, fname=fname, fix=fix, config=config)
                     )
-                )
         return linted_path
 
-    def lint_paths(self, paths, fix=False, ignore_non_existent_files=False):
+    def lint_paths(self, paths, fix=False, ignore_non_existent_files=False, parallel=1):
         """Lint an iterable of paths."""
-        # If no paths specified - assume local
+        # If no paths specified - assume local. NB: Resolved here at
+        # call time (not in a default argument, which would freeze the
+        # working directory at import time) and only once per call.
         if len(paths) == 0:
             paths = (os.getcwd(),)
         # Set up the result to hold what we get back
@@ -967,7 +1437,10 @@ class Linter:
             # or read the file directly if it's not
             result.add(
                 self.lint_path(
-                    path, fix=fix, ignore_non_existent_files=ignore_non_existent_files
+                    path,
+                    fix=fix,
+                    ignore_non_existent_files=ignore_non_existent_files,
+                    parallel=parallel,
                 )
             )
         return result
@@ -982,14 +1455,10 @@ class Linter:
             if self.formatter:
                 self.formatter.dispatch_path(path)
             config = self.config.make_child_from_path(fname)
-            # Handle unicode issues gracefully
-            with open(
-                fname, "r", encoding="utf8", errors="backslashreplace"
-            ) as target_file:
-                yield (
-                    *self.parse_string(
-                        target_file.read(), fname=fname, recurse=recurse, config=config
-                    ),
-                    # Also yield the config
-                    config,
-                )
+            yield (
+                *self.parse_string(
+                    self._read_file(fname), fname=fname, recurse=recurse, config=config
+                ),
+                # Also yield the config
+                config,
+            )
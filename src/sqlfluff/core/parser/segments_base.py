@@ -843,15 +843,21 @@ class BaseSegment:
         Args:
             seg_type: :obj:`str` or :obj:`tuple` of :obj:`str`: which specifies
                 the type of elements to look for.
+
+        NB: This iterates with an explicit stack rather than recursive
+        generators, so that deep trees don't pay a chain of `yield from`
+        frames for every yielded segment.
         """
-        # Check this segment
-        if isinstance(seg_type, str) and self.type == seg_type:
-            yield self
-        elif isinstance(seg_type, tuple) and self.type in seg_type:
-            yield self
-        # Recurse
-        for seg in self.segments:
-            yield from seg.recursive_crawl(seg_type=seg_type)
+        if isinstance(seg_type, str):
+            seg_type = (seg_type,)
+        stack = [self]
+        while stack:
+            seg = stack.pop()
+            # Check this segment
+            if seg.type in seg_type:
+                yield seg
+            # Push the children in reverse so that we pop them in order
+            stack.extend(reversed(seg.segments))
 
     def path_to(self, other):
         """Given a segment which is assumed within self, get the intermediate segments.
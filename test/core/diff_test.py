@@ -0,0 +1,37 @@
+"""The Test file for the myers differ."""
+
+import pytest
+
+from sqlfluff.core.diff import myers_line_opcodes, myers_opcodes
+
+
+@pytest.mark.parametrize("differ", [myers_opcodes, myers_line_opcodes])
+@pytest.mark.parametrize(
+    "a,b",
+    [
+        ("", ""),
+        ("abc", "abc"),
+        ("abc", ""),
+        ("", "abc"),
+        ("abc", "abd"),
+        ("SELECT 1 from tbl", "SELECT 1 FROM tbl"),
+        ("SELECT a,b FROM tbl\n", "SELECT\n    a,\n    b\nFROM tbl\n"),
+        ("{{ foo }} bar", "foovalue bar"),
+    ],
+)
+def test__diff__myers_opcodes(a, b, differ):
+    """Test that opcodes are valid and reconstruct the second sequence."""
+    opcodes = differ(a, b)
+    reconstructed = ""
+    idx_a = idx_b = 0
+    for tag, i1, i2, j1, j2 in opcodes:
+        # Opcodes should be contiguous and cover both sequences.
+        assert i1 == idx_a
+        assert j1 == idx_b
+        if tag == "equal":
+            assert a[i1:i2] == b[j1:j2]
+        reconstructed += b[j1:j2]
+        idx_a, idx_b = i2, j2
+    assert idx_a == len(a)
+    assert idx_b == len(b)
+    assert reconstructed == b